@@ -13,14 +13,37 @@ class Config:
         
         # Database configuration
         self.db_config = {
-            'database_file': 'auction_data.db'
+            'database_file': 'auction_data.db',
+            'wal_mode': True  # WAL journal with relaxed syncs; False keeps SQLite's DELETE mode
         }
         
         # Scraping configuration
         self.scraping_config = {
             'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'user_agents': [
+                'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+                'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15',
+                'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0',
+                'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36'
+            ],
             'request_timeout': 30,
-            'max_retries': 3
+            'max_retries': 3,
+            'host_cooldown': 60,  # Seconds to halve a host's request rate after a 429/503
+            # Per-host (requests per second, burst capacity) for research requests
+            'rate_limits': {
+                'www.ebay.com': (2.0, 5),
+                'www.amazon.com': (1.0, 3),
+                'api.algopix.com': (2.0, 5),
+                'default': (0.5, 1)
+            },
+            'research_workers': 4,
+            'research_processes': 0,  # Worker processes for research; 0 uses threads
+            'research_batch_size': 100,  # Research rows buffered per database commit
+            'research_cache_ttl': 86400,  # Seconds to reuse cached Algopix results
+            'scrape_workers': 16,  # Item pages fetched concurrently
+            'lot_page_length': 500,  # Lots per GraphQL page when scraping an auction
+            'parse_workers': 0,  # Worker processes for lot descriptions; 0 parses in-process
+            'page_cache_size': 1024  # Item pages kept for ETag/Last-Modified revalidation
         }
     
     def get(self, key):
@@ -34,6 +57,10 @@ class Config:
             return True
         return False
     
+    def get_database_path(self):
+        """Get path to the SQLite database file"""
+        return self.db_config['database_file']
+    
     def get_db_config(self):
         """Get database configuration"""
         return self.db_config
@@ -1,7 +1,9 @@
 import sqlite3
 import csv
+import json
+import time
 from datetime import datetime
-from typing import Dict, Optional, List, Union, Any
+from typing import Dict, Optional, List, Tuple, Union, Any
 import logging
 import traceback
 
@@ -9,6 +11,9 @@ import traceback
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Lowest bound-parameter limit across SQLite builds (pre-3.32 default)
+SQLITE_MAX_PARAMS = 999
+
 class Database:
     def __init__(self, config=None):
         self.config = config
@@ -23,6 +28,16 @@ class Database:
             self.conn = sqlite3.connect(self.db_path)
             self.cursor = self.conn.cursor()
             
+            # WAL lets commits append to a log instead of rewriting pages,
+            # and synchronous=NORMAL only syncs it at checkpoints
+            if self.config.get_db_config().get('wal_mode', True):
+                self.conn.executescript('''
+                    PRAGMA journal_mode=WAL;
+                    PRAGMA synchronous=NORMAL;
+                    PRAGMA temp_store=MEMORY;
+                    PRAGMA cache_size=-65536;
+                ''')
+            
             # Create products table
             self.cursor.execute('''
                 CREATE TABLE IF NOT EXISTS products (
@@ -90,7 +105,30 @@ class Database:
                     price REAL,
                     FOREIGN KEY (auction_id) REFERENCES auctions (id),
                     FOREIGN KEY (upc) REFERENCES products (upc),
-                    PRIMARY KEY (auction_id, upc)
+                    UNIQUE (auction_id, upc)
+                )
+            ''')
+            
+            # Create research_data table
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS research_data (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    item_id INTEGER,
+                    marketplace TEXT,
+                    price REAL,
+                    url TEXT
+                )
+            ''')
+            self.cursor.execute(
+                'CREATE INDEX IF NOT EXISTS idx_research_item ON research_data (item_id)'
+            )
+            
+            # Create research_cache table
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS research_cache (
+                    key TEXT PRIMARY KEY,
+                    payload TEXT,
+                    ts INTEGER
                 )
             ''')
             
@@ -446,17 +484,90 @@ class Database:
         Returns:
             bool: True if successful, False otherwise
         """
+        return self.save_auction_items(auction_id, [(lot_number, current_bid, upc)])
+
+    def save_auction_items(self, auction_id: int, rows: List[Tuple[str, float, str]]) -> bool:
+        """
+        Save many auction items in a single transaction.
+        
+        Rows are packed into multi-row INSERT statements, as many per statement
+        as SQLite's bound-parameter limit allows. A row whose (auction_id, upc)
+        pair already exists updates that lot's number and current bid, so
+        re-scraping an auction refreshes its bids.
+        
+        Args:
+            auction_id: ID of the auction
+            rows: List of (lot_number, current_bid, upc) tuples
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not rows:
+            return True
+        
         try:
-            self.cursor.execute('''
-                INSERT INTO auction_items (auction_id, lot_number, current_bid, upc)
+            per_stmt = SQLITE_MAX_PARAMS // 4
+            for start in range(0, len(rows), per_stmt):
+                chunk = rows[start:start + per_stmt]
+                params = []
+                for lot_number, current_bid, upc in chunk:
+                    params.extend((auction_id, lot_number, current_bid, upc))
+                self.cursor.execute(
+                    'INSERT INTO auction_items (auction_id, lot_number, current_bid, upc) VALUES '
+                    + ','.join(['(?, ?, ?, ?)'] * len(chunk))
+                    + ' ON CONFLICT (auction_id, upc) DO UPDATE SET'
+                    ' lot_number = excluded.lot_number, current_bid = excluded.current_bid',
+                    params
+                )
+            
+            self.conn.commit()
+            return True
+            
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            logger.error(f"Error saving auction items: {str(e)}")
+            return False
+
+    def save_research_data(self, item_id: int, marketplace: str, price: float, url: str) -> bool:
+        """
+        Save a single marketplace price found while researching an item.
+        
+        Args:
+            item_id: ID of the researched item
+            marketplace: Marketplace the price came from (e.g. 'eBay', 'Amazon')
+            price: Listed price
+            url: URL of the listing
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self.save_research_data_many([(item_id, marketplace, price, url)])
+    
+    def save_research_data_many(self, rows: List[Tuple[int, str, float, str]]) -> bool:
+        """
+        Save many marketplace prices in a single transaction.
+        
+        Args:
+            rows: List of (item_id, marketplace, price, url) tuples
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if not rows:
+            return True
+        
+        try:
+            self.cursor.executemany('''
+                INSERT INTO research_data (item_id, marketplace, price, url)
                 VALUES (?, ?, ?, ?)
-            ''', (auction_id, lot_number, current_bid, upc))
+            ''', rows)
             
             self.conn.commit()
             return True
             
         except sqlite3.Error as e:
-            logger.error(f"Error saving auction item: {str(e)}")
+            self.conn.rollback()
+            logger.error(f"Error saving research data: {str(e)}")
             return False
 
     def list_all_products(self, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
@@ -517,4 +628,48 @@ class Database:
             return self.cursor.fetchone()[0]
         except sqlite3.Error as e:
             logger.error(f"Error getting product count: {str(e)}")
-            return 0 
\ No newline at end of file
+            return 0
+    
+    def get_cached_research(self, key: str, max_age: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached research result if it is newer than max_age.
+        
+        Args:
+            key: Cache key
+            max_age: Maximum age of the entry in seconds
+            
+        Returns:
+            Cached result, or None if missing or expired
+        """
+        try:
+            self.cursor.execute(
+                'SELECT payload FROM research_cache WHERE key = ? AND ts >= ?',
+                (key, int(time.time()) - max_age)
+            )
+            row = self.cursor.fetchone()
+            return json.loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            logger.error(f"Error reading research cache: {str(e)}")
+            return None
+    
+    def save_cached_research(self, key: str, payload: Dict[str, Any]) -> bool:
+        """
+        Store a research result in the cache.
+        
+        Args:
+            key: Cache key
+            payload: Research result to cache
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            self.cursor.execute(
+                'INSERT OR REPLACE INTO research_cache (key, payload, ts) VALUES (?, ?, ?)',
+                (key, json.dumps(payload), int(time.time()))
+            )
+            self.conn.commit()
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Error saving research cache: {str(e)}")
+            return False
@@ -8,7 +8,6 @@ from database import Database
 from research import PriceResearch
 from calculator import Calculator
 from config import Config
-import time
 from datetime import datetime
 import sys
 import os
@@ -84,11 +83,9 @@ def process_auction_item(item_data: dict, db: Database, researcher: PriceResearc
             try:
                 # Research eBay prices
                 ebay_data = researcher.research_ebay(search_terms)
-                time.sleep(2)  # Rate limiting
                 
                 # Research Amazon prices
                 amazon_data = researcher.research_amazon(search_terms)
-                time.sleep(2)  # Rate limiting
                 
                 # Combine all data
                 update_data = {
@@ -203,18 +200,18 @@ def process_auction_url(url: str, db: Database) -> None:
     try:
         # Initialize scraper and researcher
         config = Config()
-        scraper = HiBidScraper(config)
-        researcher = PriceResearch(config)
         
         # Scrape auction items
-        items = scraper.scrape_auction(url)
+        with HiBidScraper(config) as scraper:
+            items = scraper.scrape_auction(url)
         if not items:
             logger.error(f"No items found in auction: {url}")
             return
             
         # Process each item
-        for item in items:
-            process_auction_item(item, db, researcher)
+        with PriceResearch(config) as researcher:
+            for item in items:
+                process_auction_item(item, db, researcher)
             
         logger.info(f"Successfully processed {len(items)} items from auction: {url}")
         
@@ -232,7 +229,6 @@ def process_research_request(search_terms: Dict[str, str], db: Database) -> None
     """
     try:
         config = Config()
-        researcher = PriceResearch(config)
         
         # Get product from database
         product = db.get_product_by_upc(search_terms.get('upc'))
@@ -241,9 +237,9 @@ def process_research_request(search_terms: Dict[str, str], db: Database) -> None
             return
             
         # Research prices
-        ebay_data = researcher.research_ebay(search_terms)
-        time.sleep(2)  # Rate limiting
-        amazon_data = researcher.research_amazon(search_terms)
+        with PriceResearch(config) as researcher:
+            ebay_data = researcher.research_ebay(search_terms)
+            amazon_data = researcher.research_amazon(search_terms)
         
         # Update product data
         update_data = {
@@ -1,51 +1,414 @@
+from __future__ import annotations
+
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+import soupsieve as sv
 import time
 import re
-from typing import Dict, List, Optional, Tuple, Union
+import itertools
+import functools
+import hashlib
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 import logging
 from statistics import mean
 from database import Database
-from urllib.parse import quote_plus
-import traceback
+from urllib.parse import quote_plus, urlparse
 import json
-from sklearn.ensemble import RandomForestRegressor
-import numpy as np
-import joblib
+import pickle
 import os
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+if TYPE_CHECKING:
+    import numpy as np
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Feature encoding for the price prediction model
+COMMON_BRANDS = [
+    'apple', 'samsung', 'sony', 'lg', 'microsoft', 'dell', 'hp', 'lenovo',
+    'amazon', 'google', 'logitech', 'bose', 'jbl', 'anker', 'belkin'
+]
+CONDITION_MAP = {
+    'new': 1.0,
+    'like new': 0.9,
+    'open box': 0.8,
+    'excellent': 0.8,
+    'very good': 0.7,
+    'good': 0.6,
+    'acceptable': 0.5,
+    'fair': 0.4,
+    'poor': 0.3
+}
+CATEGORIES = [
+    'electronics', 'computers', 'phones', 'tablets', 'gaming',
+    'audio', 'smart home', 'wearables', 'accessories'
+]
+
+# Feature column layout: categorical brand id, condition, damage, missing items,
+# and a bitmask of matched categories
+_BRAND_INDEX = {brand: i for i, brand in enumerate(COMMON_BRANDS)}
+_BRAND_COL = 0
+_CONDITION_COL = 1
+_DAMAGE_COL = 2
+_MISSING_COL = 3
+_CATEGORY_COL = 4
+N_FEATURES = 5
+
+# Amazon selectors, compiled once at import. Lists are tried in order
+# (Amazon's HTML structure varies)
+_AMAZON_PRICE_SELECTORS = tuple(sv.compile(selector) for selector in (
+    'span.a-price span.a-offscreen',  # Common price selector
+    'span.a-price-whole',  # Alternative price selector
+    'span#priceblock_ourprice',  # Another common selector
+    'span#priceblock_dealprice'  # Deal price selector
+))
+_AMAZON_DISCOUNT_SELECTORS = tuple(sv.compile(selector) for selector in (
+    'span.savingsPercentage',  # Common discount selector
+    'span.a-size-large.a-color-price.savingPriceOverride'  # Alternative selector
+))
+_AMAZON_RESULT_LINK = sv.compile('div[data-component-type="s-search-result"] a.a-link-normal')
+_AMAZON_RATING = sv.compile('span.a-icon-alt')
+_AMAZON_REVIEWS = sv.compile('span#acrCustomerReviewText')
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+    
+    Tokens refill at `rate` per second up to `capacity`, so bursts go out
+    immediately and callers only sleep once the bucket is empty. A penalty
+    halves the rate, which then doubles back toward the base rate after
+    each penalty window without further penalties. Penalties arriving within
+    the window of the last halving only extend it, and the rate never drops
+    below an eighth of the base rate.
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.penalty_window = 0.0
+        self.penalty_until = 0.0
+        self.penalized_at = float('-inf')
+        self.lock = threading.Lock()
+    
+    def _refill(self, now: float, recover: bool = True):
+        """Add tokens for the time elapsed and recover from expired penalties"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        
+        if recover and self.rate < self.base_rate and now >= self.penalty_until:
+            self.rate = min(self.base_rate, self.rate * 2)
+            self.penalty_until = now + self.penalty_window
+    
+    def acquire(self):
+        """Take a token, sleeping only if the bucket is empty"""
+        with self.lock:
+            self._refill(time.monotonic())
+            # Reserve the token now; a negative balance queues callers in order
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        
+        if wait > 0:
+            time.sleep(wait)
+    
+    def penalize(self, duration: float):
+        """Halve the refill rate for `duration` seconds"""
+        with self.lock:
+            now = time.monotonic()
+            # No recovery step here: a fresh 429 means the current rate is still too high
+            self._refill(now, recover=False)
+            self.penalty_window = duration
+            self.penalty_until = now + duration
+            
+            # Workers hit by the same burst of 429s only halve the rate once
+            if now < self.penalized_at + duration:
+                return
+            self.penalized_at = now
+            self.rate = max(self.rate / 2, self.base_rate / 8)
+
+class MarketplaceFetcher:
+    """
+    Fetches marketplace search results over a pooled session.
+    
+    Holds only the HTTP state research needs: the session, User-Agent
+    rotation and per-host rate limiters. PriceResearch uses one internally,
+    and each research worker process builds its own.
+    """
+    
+    _PRICE_RE = re.compile(r'\d[\d,]*(?:\.\d+)?')
+    
+    def __init__(self, scraping_config: Dict[str, Any]):
+        """Set up the pooled session, User-Agent rotation and per-host rate limiters"""
+        self.scraping_config = scraping_config
+        self.session = requests.Session()
+        
+        # Keep one pooled keep-alive connection per research worker
+        pool_size = max(self.scraping_config.get('research_workers', 4), 10)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Rotate User-Agent strings per request to reduce CAPTCHA responses
+        self.ua_pool = list(self.scraping_config.get('user_agents', [self.scraping_config['user_agent']]))
+        self._ua_iter = itertools.cycle(self.ua_pool)
+        
+        # Per-host rate limiters, shared by the research worker threads
+        self._host_buckets = {}
+        self._host_buckets_lock = threading.Lock()
+    
+    def close(self):
+        """Close the HTTP session"""
+        self.session.close()
+    
+    def make_request(self, url: str) -> Optional[requests.Response]:
+        """
+        Make a rate-limited GET request with a rotated User-Agent.
+        
+        Requests only wait when the host's token bucket is empty. A 429/503
+        answer slows that host down instead of retrying, since the page would
+        only be a CAPTCHA or error page.
+        
+        Returns:
+            Response object, or None if the host rate limited us
+        """
+        bucket = self.get_host_bucket(url)
+        bucket.acquire()
+        
+        headers = {'User-Agent': next(self._ua_iter)}
+        response = self.session.get(url, headers=headers, timeout=self.scraping_config['request_timeout'])
+        
+        if response.status_code in (429, 503):
+            self.penalize_host(url, bucket, response.status_code)
+            return None
+        
+        response.raise_for_status()
+        return response
+    
+    def get_host_bucket(self, url: str) -> 'TokenBucket':
+        """Get the rate limiter for the host of url, creating it on first use"""
+        host = urlparse(url).netloc
+        with self._host_buckets_lock:
+            bucket = self._host_buckets.get(host)
+            if bucket is None:
+                rate_limits = self.scraping_config.get('rate_limits', {})
+                rate, capacity = rate_limits.get(host, rate_limits.get('default', (0.5, 1)))
+                bucket = TokenBucket(rate, capacity)
+                self._host_buckets[host] = bucket
+        return bucket
+    
+    def penalize_host(self, url: str, bucket: 'TokenBucket', status_code: int):
+        """Halve a host's request rate after it answers 429/503"""
+        backoff = self.scraping_config.get('host_cooldown', 60)
+        bucket.penalize(backoff)
+        logger.warning(f"{urlparse(url).netloc} returned {status_code}, "
+                       f"slowing to {bucket.rate:.2f} req/s for {backoff}s")
+    
+    def fetch_research_rows(self, item_id: int, title: str, marketplace: str) -> List[Tuple[int, str, float, str]]:
+        """Research one marketplace for an item and return research_data rows"""
+        research = self.search_ebay if marketplace == 'eBay' else self.search_amazon
+        return [(item_id, marketplace, price, url) for price, url in research(title)]
+    
+    def parse_price(self, text: str) -> Optional[float]:
+        """Parse the first price in text, e.g. '$1,234.56' or '$10.00 to $20.00'"""
+        match = self._PRICE_RE.search(text)
+        return float(match.group().replace(',', '')) if match else None
+    
+    def search_ebay(self, title):
+        """Research prices on eBay"""
+        prices = []
+        try:
+            # Construct eBay search URL
+            search_query = title.replace(' ', '+')
+            url = f"https://www.ebay.com/sch/i.html?_nkw={search_query}&_sop=15"  # Sort by price + shipping
+            
+            response = self.make_request(url)
+            if not response:
+                return prices
+            
+            soup = BeautifulSoup(response.content, 'lxml')
+            items = soup.find_all('div', class_='s-item__info')
+            
+            for item in items[:5]:  # Get top 5 results
+                price_element = item.find('span', class_='s-item__price')
+                price = self.parse_price(price_element.text) if price_element else None
+                if price is None:
+                    continue
+                
+                url_element = item.find('a', class_='s-item__link')
+                url = url_element.get('href', '') if url_element else ''
+                prices.append((price, url))
+                    
+        except requests.RequestException as e:
+            print(f"Error researching eBay: {str(e)}")
+        
+        return prices
+    
+    def search_amazon(self, title):
+        """Research prices on Amazon"""
+        prices = []
+        try:
+            # Construct Amazon search URL
+            search_query = title.replace(' ', '+')
+            url = f"https://www.amazon.com/s?k={search_query}&sort=price-asc-rank"
+            
+            response = self.make_request(url)
+            if not response:
+                return prices
+            
+            soup = BeautifulSoup(response.content, 'lxml')
+            items = soup.find_all('div', class_='s-result-item')
+            
+            for item in items[:5]:  # Get top 5 results
+                price_element = item.find('span', class_='a-price-whole')
+                price = self.parse_price(price_element.text) if price_element else None
+                if price is None:
+                    continue
+                
+                url_element = item.find('a', class_='a-link-normal')
+                url = f"https://www.amazon.com{url_element.get('href', '')}" if url_element else ''
+                prices.append((price, url))
+                    
+        except requests.RequestException as e:
+            print(f"Error researching Amazon: {str(e)}")
+        
+        return prices
+
+# Price models shared across PriceResearch instances, keyed by model path
+_MODEL_CACHE = {}
+_MODEL_LOCK = threading.Lock()
+
+def _new_model():
+    """Create an untrained price model with the brand column treated as categorical"""
+    from sklearn.ensemble import HistGradientBoostingRegressor
+    return HistGradientBoostingRegressor(categorical_features=[_BRAND_COL], random_state=42)
+
+def _featurize(brand_ids: np.ndarray, cond_vals: np.ndarray, damage: np.ndarray,
+               missing: np.ndarray, cat_mask: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Assemble the model feature matrix from pre-encoded numeric arrays.
+    
+    Args:
+        brand_ids: Index into COMMON_BRANDS per row, -1 for unknown brands (encoded as missing)
+        cond_vals: Condition score per row
+        damage: 1 if the item is damaged
+        missing: 1 if the item has missing parts
+        cat_mask: (rows, len(CATEGORIES)) matrix of category matches
+        out: Optional preallocated (rows, N_FEATURES) array to fill in place
+        
+    Returns:
+        Feature array of shape (rows, N_FEATURES), float32 unless out is given
+    """
+    import numpy as np
+    
+    n = len(brand_ids)
+    X = out if out is not None else np.empty((n, N_FEATURES), dtype=np.float32)
+    
+    X[:, _BRAND_COL] = np.where(brand_ids >= 0, brand_ids, np.nan)
+    X[:, _CONDITION_COL] = cond_vals
+    X[:, _DAMAGE_COL] = damage
+    X[:, _MISSING_COL] = missing
+    X[:, _CATEGORY_COL] = cat_mask.astype(np.uint32) @ (1 << np.arange(cat_mask.shape[1], dtype=np.uint32))
+    
+    return X
+
 class PriceResearch:
     """Handles price research using Algopix API and ML predictions"""
     
+    _RATING_RE = re.compile(r'(\d+\.?\d*) out of 5')
+    _REVIEWS_RE = re.compile(r'([\d,]+)')
+    _RETURN_RE = re.compile(r'frequently returned|high return rate|commonly returned', re.I)
+    _RETURN_BYTES_RE = re.compile(rb'frequently returned|high return rate|commonly returned', re.I)
+    
     def __init__(self, config):
         """Initialize with configuration"""
         self.config = config
         self.scraping_config = config.get_scraping_config()
-        self.session = requests.Session()
+        self.fetcher = MarketplaceFetcher(self.scraping_config)
+        
+        self._algopix_headers = {
+            'Authorization': f"Bearer {self.scraping_config.get('algopix_api_key', '')}",
+            'Accept': 'application/json'
+        }
+        
+        self.db = Database(config)
+        
         self.model = None
         self.model_path = 'price_model.joblib'
+        self._pred_buf = None
+        self._pred_lock = threading.Lock()
+        self._predict_cached = functools.lru_cache(maxsize=4096)(self._predict_from_key)
         self._load_or_train_model()
     
+    def close(self):
+        """Close the HTTP session and database connection"""
+        self.fetcher.close()
+        self.db.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+    
     def _load_or_train_model(self):
-        """Load existing model or train a new one"""
+        """
+        Load existing model or train a new one.
+        
+        Models are shared by every PriceResearch in the process, so the
+        model file is only loaded once per path. Worker processes forked
+        after the first load inherit it copy-on-write.
+        """
+        with _MODEL_LOCK:
+            model = _MODEL_CACHE.get(self.model_path)
+            if model is None:
+                model = self._load_model()
+                _MODEL_CACHE[self.model_path] = model
+        
+        self.model = model
+    
+    def _load_model(self):
+        """Load the model from disk, or create an untrained one"""
+        # ML dependencies are imported on first use so scraping-only callers skip them
+        import joblib
+        
         try:
             if os.path.exists(self.model_path):
-                self.model = joblib.load(self.model_path)
-                logger.info("Loaded existing price prediction model")
-            else:
-                self.model = RandomForestRegressor(n_estimators=100, random_state=42)
-                logger.info("Created new price prediction model")
+                # Memory-map the tree arrays instead of reading them all into RAM
+                model = joblib.load(self.model_path, mmap_mode='r')
+                if getattr(model, 'n_features_in_', N_FEATURES) == N_FEATURES:
+                    logger.info("Loaded existing price prediction model")
+                    return model
+                logger.warning("Existing price prediction model uses an old feature layout, discarding it")
         except Exception as e:
             logger.error(f"Error loading/training model: {str(e)}")
-            self.model = RandomForestRegressor(n_estimators=100, random_state=42)
+        
+        logger.info("Created new price prediction model")
+        return _new_model()
     
     def _get_algopix_data(self, search_terms: Dict[str, str]) -> Optional[Dict[str, Any]]:
         """Get market data from Algopix API"""
         try:
+            # Identical search terms reuse a recent result instead of hitting the API
+            cache_key = hashlib.blake2b(
+                json.dumps(search_terms, sort_keys=True).encode(), digest_size=16
+            ).hexdigest()
+            cache_ttl = self.scraping_config.get('research_cache_ttl', 86400)
+            cached = self.db.get_cached_research(cache_key, cache_ttl)
+            if cached:
+                return cached
+            
             # Construct search query
             query_parts = []
             if search_terms.get('upc'):
@@ -59,10 +422,6 @@ class PriceResearch:
             
             # Make API request
             url = "https://api.algopix.com/v3/market/search"
-            headers = {
-                'Authorization': f"Bearer {self.scraping_config.get('algopix_api_key', '')}",
-                'Accept': 'application/json'
-            }
             params = {
                 'q': search_query,
                 'marketplace': 'ebay',
@@ -70,12 +429,16 @@ class PriceResearch:
                 'include': 'prices,competitors,trends'
             }
             
-            response = self.session.get(url, headers=headers, params=params, timeout=30)
+            bucket = self.fetcher.get_host_bucket(url)
+            bucket.acquire()
+            response = self.fetcher.session.get(url, headers=self._algopix_headers, params=params, timeout=30)
+            if response.status_code == 429:
+                self.fetcher.penalize_host(url, bucket, response.status_code)
             if response.status_code != 200:
                 logger.error(f"Algopix API error: {response.status_code}")
                 return None
             
-            data = response.json()
+            data = _json_loads(response.content)
             market_data = data.get('market_data', {})
             
             if not market_data:
@@ -86,7 +449,7 @@ class PriceResearch:
             competitors = market_data.get('competitors', {})
             trends = market_data.get('trends', {})
             
-            return {
+            result = {
                 'ebay_lowest_sold': prices.get('lowest_sold', 0.0),
                 'ebay_average_sold': prices.get('average_sold', 0.0),
                 'ebay_highest_sold': prices.get('highest_sold', 0.0),
@@ -97,6 +460,9 @@ class PriceResearch:
                 'demand_trend': trends.get('demand_trend', 'stable')
             }
             
+            self.db.save_cached_research(cache_key, result)
+            return result
+            
         except Exception as e:
             logger.error(f"Error fetching Algopix data: {str(e)}")
             return None
@@ -104,11 +470,8 @@ class PriceResearch:
     def _predict_price(self, product_data: Dict[str, Any]) -> Dict[str, float]:
         """Predict prices using ML model"""
         try:
-            # Prepare features for prediction
-            features = self._prepare_features(product_data)
-            
-            # Make prediction
-            predicted_price = self.model.predict([features])[0]
+            # Make prediction, reusing earlier results for identical feature inputs
+            predicted_price = self._predict_cached(self._feature_key(product_data))
             
             # Calculate price range based on historical data
             price_range = predicted_price * 0.2  # 20% range
@@ -137,49 +500,77 @@ class PriceResearch:
                 'demand_trend': 'unknown'
             }
     
-    def _prepare_features(self, product_data: Dict[str, Any]) -> List[float]:
-        """Prepare features for ML model"""
-        # Convert product data into numerical features
-        features = []
-        
-        # Add brand as one-hot encoded feature
-        brand = product_data.get('brand', '').lower()
-        common_brands = [
-            'apple', 'samsung', 'sony', 'lg', 'microsoft', 'dell', 'hp', 'lenovo',
-            'amazon', 'google', 'logitech', 'bose', 'jbl', 'anker', 'belkin'
-        ]
-        features.extend([1 if b == brand else 0 for b in common_brands])
-        
-        # Add condition as numerical value
-        condition = product_data.get('condition', '').lower()
-        condition_map = {
-            'new': 1.0,
-            'like new': 0.9,
-            'open box': 0.8,
-            'excellent': 0.8,
-            'very good': 0.7,
-            'good': 0.6,
-            'acceptable': 0.5,
-            'fair': 0.4,
-            'poor': 0.3
+    @staticmethod
+    def _feature_key(product_data: Dict[str, Any]) -> Tuple[str, str, bool, bool, str]:
+        """Hashable key of the product fields the model features depend on"""
+        return (
+            (product_data.get('brand') or '').lower(),
+            (product_data.get('condition') or '').lower(),
+            bool(product_data.get('damage')),
+            bool(product_data.get('missing_items')),
+            (product_data.get('category') or '').lower()
+        )
+    
+    def _predict_from_key(self, key: Tuple[str, str, bool, bool, str]) -> float:
+        """Predict the average sold price for a feature key"""
+        import numpy as np
+        
+        brand, condition, damage, missing_items, category = key
+        product_data = {
+            'brand': brand,
+            'condition': condition,
+            'damage': damage,
+            'missing_items': missing_items,
+            'category': category
         }
-        features.append(condition_map.get(condition, 0.5))
         
-        # Add damage indicator
-        features.append(1.0 if product_data.get('damage', False) else 0.0)
+        # Fill a reusable single-row buffer in place. It is float64 because
+        # that is what the model validates input to, so predict makes no copy.
+        with self._pred_lock:
+            if self._pred_buf is None:
+                self._pred_buf = np.empty((1, N_FEATURES), dtype=np.float64)
+            self._prepare_features_batch([product_data], out=self._pred_buf)
+            return float(self.model.predict(self._pred_buf)[0])
+    
+    def _prepare_features(self, product_data: Dict[str, Any]) -> np.ndarray:
+        """Prepare features for ML model"""
+        return self._prepare_features_batch([product_data])[0]
+    
+    def _prepare_features_batch(self, items: List[Dict[str, Any]], out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Prepare the feature matrix for a batch of products.
         
-        # Add missing items indicator
-        features.append(1.0 if product_data.get('missing_items', False) else 0.0)
+        String fields are mapped to numeric codes in one pass over the batch,
+        then _featurize assembles the matrix with whole-array operations.
         
-        # Add category-specific features
-        category = product_data.get('category', '').lower()
-        categories = [
-            'electronics', 'computers', 'phones', 'tablets', 'gaming',
-            'audio', 'smart home', 'wearables', 'accessories'
-        ]
-        features.extend([1 if c in category else 0 for c in categories])
+        Args:
+            items: List of product data dictionaries
+            out: Optional preallocated (len(items), N_FEATURES) array to fill in place
+            
+        Returns:
+            Array of shape (len(items), N_FEATURES)
+        """
+        import numpy as np
         
-        return features
+        n = len(items)
+        brand_ids = np.fromiter(
+            (_BRAND_INDEX.get((item.get('brand') or '').lower(), -1) for item in items),
+            dtype=np.int32, count=n
+        )
+        cond_vals = np.fromiter(
+            (CONDITION_MAP.get((item.get('condition') or '').lower(), 0.5) for item in items),
+            dtype=np.float32, count=n
+        )
+        damage = np.fromiter((bool(item.get('damage')) for item in items), dtype=np.uint8, count=n)
+        missing = np.fromiter((bool(item.get('missing_items')) for item in items), dtype=np.uint8, count=n)
+        
+        # Category features match on substring, one vectorized test per category
+        categories = np.array([(item.get('category') or '').lower() for item in items], dtype=str)
+        cat_mask = np.empty((n, len(CATEGORIES)), dtype=np.uint8)
+        for offset, category in enumerate(CATEGORIES):
+            cat_mask[:, offset] = np.char.find(categories, category) >= 0
+        
+        return _featurize(brand_ids, cond_vals, damage, missing, cat_mask, out=out)
     
     def research_ebay(self, search_terms: Dict[str, str]) -> Dict[str, Any]:
         """
@@ -203,7 +594,7 @@ class PriceResearch:
             
         except Exception as e:
             logger.error(f"Error in eBay research: {str(e)}")
-            logger.debug(traceback.format_exc())
+            logger.debug("eBay research traceback", exc_info=True)
             return {
                 'ebay_lowest_sold': 0.0,
                 'ebay_average_sold': 0.0,
@@ -217,132 +608,125 @@ class PriceResearch:
     
     def update_model(self, new_data: List[Dict[str, Any]]):
         """Update the ML model with new data"""
+        import joblib
+        from sklearn.base import clone
+        
         try:
             if not new_data:
                 return
             
             # Prepare training data
-            X = [self._prepare_features(item) for item in new_data]
+            X = self._prepare_features_batch(new_data)
             y = [item.get('ebay_average_sold', 0.0) for item in new_data]
             
-            # Update model
-            self.model.fit(X, y)
+            # Fit a fresh copy so other instances sharing the current model are unaffected
+            model = clone(self.model)
+            model.fit(X, y)
+            
+            self.model = model
+            self._predict_cached.cache_clear()
+            with _MODEL_LOCK:
+                _MODEL_CACHE[self.model_path] = model
             
             # Save updated model
-            joblib.dump(self.model, self.model_path)
+            # Stored uncompressed so the arrays can be memory-mapped on load
+            joblib.dump(self.model, self.model_path, protocol=pickle.HIGHEST_PROTOCOL)
             logger.info("Model updated and saved")
             
         except Exception as e:
             logger.error(f"Error updating model: {str(e)}")
-            logger.debug(traceback.format_exc())
+            logger.debug("Model update traceback", exc_info=True)
 
     def research(self, item_id=None):
         """Research prices for items"""
-        db = Database(self.config)
-        
+        # Reuse the cache connection; close() releases it
         if item_id:
             # Research specific item
-            self._research_item(db, item_id)
+            self._research_item(self.db, item_id)
         else:
             # Research all items without research data
-            self._research_all_items(db)
-        
-        db.close()
+            self._research_all_items(self.db)
     
     def _research_all_items(self, db):
-        """Research prices for all items without research data"""
-        db.cursor.execute('''
-            SELECT id, title FROM items
-            WHERE id NOT IN (SELECT item_id FROM research_data)
+        """Research prices for all auction lots without research data"""
+        # Read pending lots on a separate cursor in arraysize chunks so large
+        # catalogs are never materialized at once; db.cursor is used for writes.
+        # research_data.item_id refers to auction_items.id, and a lot's title
+        # is its product's name.
+        cursor = db.conn.cursor()
+        cursor.arraysize = 1000
+        cursor.execute('''
+            SELECT ai.id, p.name FROM auction_items ai
+            JOIN products p ON p.upc = ai.upc
+            LEFT JOIN research_data r ON r.item_id = ai.id
+            WHERE r.item_id IS NULL AND p.name IS NOT NULL AND p.name != ''
         ''')
-        items = db.cursor.fetchall()
         
-        for item_id, title in items:
-            self._research_item(db, item_id)
-            time.sleep(2)  # Be nice to the servers
+        # Fan the marketplace lookups out across workers. Threads share this
+        # instance's fetcher and its per-host politeness. Worker processes each
+        # build their own MarketplaceFetcher with its own rate limiters, so
+        # every host's rate and burst is split between them to keep the total
+        # within rate_limits. All database writes stay on this thread since
+        # the SQLite connection can't be shared.
+        processes = self.scraping_config.get('research_processes', 0)
+        if processes:
+            executor = ProcessPoolExecutor(
+                max_workers=processes,
+                initializer=_worker_init,
+                initargs=(_split_rate_limits(self.scraping_config, processes),)
+            )
+            fetch = _worker_research
+        else:
+            executor = ThreadPoolExecutor(max_workers=self.scraping_config.get('research_workers', 4))
+            fetch = self.fetcher.fetch_research_rows
+        
+        batch_size = self.scraping_config.get('research_batch_size', 100)
+        rows = []
+        with executor:
+            while True:
+                items = cursor.fetchmany()
+                if not items:
+                    break
+                
+                futures = {}
+                for item_id, title in items:
+                    for marketplace in ('eBay', 'Amazon'):
+                        futures[executor.submit(fetch, item_id, title, marketplace)] = (item_id, marketplace)
+                
+                for future in as_completed(futures):
+                    item_id, marketplace = futures[future]
+                    try:
+                        rows.extend(future.result())
+                    except Exception as e:
+                        logger.error(f"Error researching {marketplace} for item {item_id}: {str(e)}")
+                        continue
+                    
+                    if len(rows) >= batch_size:
+                        db.save_research_data_many(rows)
+                        rows = []
+        
+        db.save_research_data_many(rows)
+        cursor.close()
     
     def _research_item(self, db, item_id):
-        """Research prices for a specific item"""
-        # Get item details
-        db.cursor.execute('SELECT title FROM items WHERE id = ?', (item_id,))
+        """Research prices for a specific auction lot"""
+        # Get the lot's title from its product
+        db.cursor.execute('''
+            SELECT p.name FROM auction_items ai
+            JOIN products p ON p.upc = ai.upc
+            WHERE ai.id = ? AND p.name IS NOT NULL AND p.name != ''
+        ''', (item_id,))
         item = db.cursor.fetchone()
         if not item:
             return
         
         title = item[0]
         
-        # Research eBay prices
-        ebay_prices = self._research_ebay(title)
-        for price, url in ebay_prices:
-            db.save_research_data(item_id, 'eBay', price, url)
-        
-        # Research Amazon prices
-        amazon_prices = self._research_amazon(title)
-        for price, url in amazon_prices:
-            db.save_research_data(item_id, 'Amazon', price, url)
-    
-    def _research_ebay(self, title):
-        """Research prices on eBay"""
-        prices = []
-        try:
-            # Construct eBay search URL
-            search_query = title.replace(' ', '+')
-            url = f"https://www.ebay.com/sch/i.html?_nkw={search_query}&_sop=15"  # Sort by price + shipping
-            
-            response = self._make_request(url)
-            if not response:
-                return prices
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            items = soup.find_all('div', class_='s-item__info')
-            
-            for item in items[:5]:  # Get top 5 results
-                try:
-                    price_element = item.find('span', class_='s-item__price')
-                    if price_element:
-                        price = float(price_element.text.strip().replace('$', '').replace(',', ''))
-                        url_element = item.find('a', class_='s-item__link')
-                        url = url_element['href'] if url_element else ''
-                        prices.append((price, url))
-                except (ValueError, AttributeError):
-                    continue
-                    
-        except requests.RequestException as e:
-            print(f"Error researching eBay: {str(e)}")
-        
-        return prices
+        # Research eBay and Amazon prices, then save them in one transaction
+        rows = self.fetcher.fetch_research_rows(item_id, title, 'eBay')
+        rows.extend(self.fetcher.fetch_research_rows(item_id, title, 'Amazon'))
+        db.save_research_data_many(rows)
     
-    def _research_amazon(self, title):
-        """Research prices on Amazon"""
-        prices = []
-        try:
-            # Construct Amazon search URL
-            search_query = title.replace(' ', '+')
-            url = f"https://www.amazon.com/s?k={search_query}&sort=price-asc-rank"
-            
-            response = self._make_request(url)
-            if not response:
-                return prices
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
-            items = soup.find_all('div', class_='s-result-item')
-            
-            for item in items[:5]:  # Get top 5 results
-                try:
-                    price_element = item.find('span', class_='a-price-whole')
-                    if price_element:
-                        price = float(price_element.text.strip().replace(',', ''))
-                        url_element = item.find('a', class_='a-link-normal')
-                        url = f"https://www.amazon.com{url_element['href']}" if url_element else ''
-                        prices.append((price, url))
-                except (ValueError, AttributeError):
-                    continue
-                    
-        except requests.RequestException as e:
-            print(f"Error researching Amazon: {str(e)}")
-        
-        return prices
-
     def research_amazon(self, search_terms: Dict[str, str], direct_url: Optional[str] = None) -> Dict[str, Union[float, str, int, bool, None]]:
         """
         Scrape Amazon for product pricing and details using free methods only.
@@ -399,15 +783,15 @@ class PriceResearch:
             
             # Search Amazon
             search_url = f"https://www.amazon.com/s?k={encoded_query}"
-            response = self._make_request(search_url)
+            response = self.fetcher.make_request(search_url)
             if not response:
                 return None
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Look for product links in search results
             # Note: Amazon's HTML structure may change frequently
-            product_links = soup.select('div[data-component-type="s-search-result"] a.a-link-normal')
+            product_links = _AMAZON_RESULT_LINK.select(soup, limit=1)
             
             if product_links:
                 # Get the first product link
@@ -426,11 +810,11 @@ class PriceResearch:
         Scrape product information from an Amazon product page.
         """
         try:
-            response = self._make_request(url)
+            response = self.fetcher.make_request(url)
             if not response:
                 return self._get_default_amazon_results()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             
             # Extract price
             price = self._extract_amazon_price(soup)
@@ -442,7 +826,7 @@ class PriceResearch:
             rating, review_count = self._extract_amazon_rating(soup)
             
             # Check for frequently returned indicator
-            frequently_returned = self._check_frequently_returned(soup)
+            frequently_returned = self._check_frequently_returned(soup, response.content)
             
             return {
                 'amazon_price': price,
@@ -463,20 +847,12 @@ class PriceResearch:
         """Extract price from Amazon product page"""
         try:
             # Try different price selectors (Amazon's HTML structure varies)
-            price_selectors = [
-                'span.a-price span.a-offscreen',  # Common price selector
-                'span.a-price-whole',  # Alternative price selector
-                'span#priceblock_ourprice',  # Another common selector
-                'span#priceblock_dealprice'  # Deal price selector
-            ]
-            
-            for selector in price_selectors:
-                price_element = soup.select_one(selector)
+            for selector in _AMAZON_PRICE_SELECTORS:
+                price_element = selector.select_one(soup)
                 if price_element:
-                    price_text = price_element.text.strip()
-                    # Remove currency symbol and commas
-                    price_text = price_text.replace('$', '').replace(',', '')
-                    return float(price_text)
+                    price = self.fetcher.parse_price(price_element.text)
+                    if price is not None:
+                        return price
             
             return None
             
@@ -488,13 +864,8 @@ class PriceResearch:
         """Extract discount from Amazon product page"""
         try:
             # Look for discount indicators
-            discount_selectors = [
-                'span.savingsPercentage',  # Common discount selector
-                'span.a-size-large.a-color-price.savingPriceOverride'  # Alternative selector
-            ]
-            
-            for selector in discount_selectors:
-                discount_element = soup.select_one(selector)
+            for selector in _AMAZON_DISCOUNT_SELECTORS:
+                discount_element = selector.select_one(soup)
                 if discount_element:
                     return discount_element.text.strip()
             
@@ -508,20 +879,20 @@ class PriceResearch:
         """Extract star rating and review count from Amazon product page"""
         try:
             # Extract star rating
-            rating_element = soup.select_one('span.a-icon-alt')
+            rating_element = _AMAZON_RATING.select_one(soup)
             rating = None
             if rating_element:
                 rating_text = rating_element.text.strip()
-                match = re.search(r'(\d+\.?\d*) out of 5', rating_text)
+                match = self._RATING_RE.search(rating_text)
                 if match:
                     rating = float(match.group(1))
             
             # Extract review count
-            review_element = soup.select_one('span#acrCustomerReviewText')
+            review_element = _AMAZON_REVIEWS.select_one(soup)
             review_count = None
             if review_element:
                 review_text = review_element.text.strip()
-                match = re.search(r'(\d+,?\d*)', review_text)
+                match = self._REVIEWS_RE.search(review_text)
                 if match:
                     review_count = int(match.group(1).replace(',', ''))
             
@@ -531,18 +902,15 @@ class PriceResearch:
             logger.debug(f"Error extracting Amazon rating: {str(e)}")
             return None, None
     
-    def _check_frequently_returned(self, soup: BeautifulSoup) -> bool:
+    def _check_frequently_returned(self, soup: BeautifulSoup, content: bytes) -> bool:
         """Check if product is marked as frequently returned"""
         try:
-            # Look for frequently returned indicators
-            indicators = [
-                'frequently returned',
-                'high return rate',
-                'commonly returned'
-            ]
+            # Most pages never mention returns, so rule them out on the raw bytes first
+            if not self._RETURN_BYTES_RE.search(content):
+                return False
             
-            page_text = soup.get_text().lower()
-            return any(indicator in page_text for indicator in indicators)
+            # The match may sit in a script, comment or attribute; only count page text
+            return bool(self._RETURN_RE.search(soup.get_text()))
             
         except Exception as e:
             logger.debug(f"Error checking frequently returned status: {str(e)}")
@@ -559,4 +927,28 @@ class PriceResearch:
             'amazon_category_rating': None,
             'amazon_subcategory_rating': None,
             'amazon_sold_per_month': None
-        } 
\ No newline at end of file
+        }
+
+
+# Per-process MarketplaceFetcher used by the research worker pool
+_worker_fetcher = None
+
+def _split_rate_limits(scraping_config: Dict[str, Any], processes: int) -> Dict[str, Any]:
+    """Copy scraping_config with every host's rate and burst divided between worker processes"""
+    rate_limits = {'default': (0.5, 1), **scraping_config.get('rate_limits', {})}
+    return {
+        **scraping_config,
+        'rate_limits': {
+            host: (rate / processes, capacity / processes)
+            for host, (rate, capacity) in rate_limits.items()
+        }
+    }
+
+def _worker_init(scraping_config: Dict[str, Any]):
+    """Build one MarketplaceFetcher per worker process"""
+    global _worker_fetcher
+    _worker_fetcher = MarketplaceFetcher(scraping_config)
+
+def _worker_research(item_id: int, title: str, marketplace: str) -> List[Tuple[int, str, float, str]]:
+    """Research one marketplace for an item inside a worker process"""
+    return _worker_fetcher.fetch_research_rows(item_id, title, marketplace)
@@ -1,36 +1,262 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry, make_headers
+from bs4 import BeautifulSoup, SoupStrainer
+import asyncio
+import calendar
+import functools
+import itertools
 import time
 from datetime import datetime
 from typing import Dict, Optional, Union, Any, List
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import logging
+import re
+import threading
+import soupsieve as sv
 from database import Database
 import traceback
+from collections import OrderedDict
 import json
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# First dollar amount in a bid text, e.g. '$1,234.50' in '$1,234.50 (3 bids)'
+_MONEY_RE = re.compile(r'\d[\d,]*(?:\.\d+)?')
+
+# First all-digit path segment of an auction URL (the catalog ID)
+_AUCTION_ID_RE = re.compile(r'/(\d+)(?=[/?#]|$)')
+
+# 'Month DD, YYYY' auction dates, parsed without strptime
+_DATE_RE = re.compile(r'([A-Za-z]+)\s+(\d{1,2}),\s+(\d{4})')
+_MONTHS = {name.lower(): number for number, name in enumerate(calendar.month_name) if name}
+
+# Labelled lines of a lot description and the item field each one fills
+_FIELD_MAP = {
+    'Title': 'name',
+    'Brand': 'brand',
+    'Model': 'model',
+    'UPC': 'upc',
+    'Condition': 'condition',
+    'Functional?': 'functionality',
+    'Damaged?': 'damage',
+    'Missing Parts?': 'missing_items',
+    'Damage Description': 'damage_description',
+    'Missing Parts Description': 'missing_items_description',
+    'Notes': 'notes'
+}
+_FIELD_RE = re.compile(
+    r'^[ \t]*(' + '|'.join(re.escape(label) for label in _FIELD_MAP) + r'):(.*)$',
+    re.MULTILINE
+)
+
+# Lowercased indicator texts that mean an item is damaged / missing parts
+_DAMAGE_TRUTHY = frozenset({'yes', 'true', 'damaged'})
+_MISSING_TRUTHY = frozenset({'yes', 'true', 'missing items'})
+
+# CSS selectors for each item page field, tried in priority order:
+# the common class selector, an alternative layout, then a data attribute.
+# Compiled once at import instead of re-parsed on every select_one call.
+_FIELD_SELECTORS = {
+    field: tuple(sv.compile(selector) for selector in selectors)
+    for field, selectors in {
+        'current_bid': ('span.current-bid-amount', 'div.bid-amount', 'span[data-bid-amount]'),
+        'lot_number': ('span.lot-number', 'div.lot-info span', 'span[data-lot-number]'),
+        'name': ('h1.item-title', 'div.item-details h1', 'span[data-item-name]'),
+        'brand': ('span.brand-name', 'div.item-details span', 'span[data-brand]'),
+        'model': ('span.model-number', 'div.item-details span', 'span[data-model]'),
+        'upc': ('span.upc-code', 'div.item-details span', 'span[data-upc]'),
+        'condition': ('span.item-condition', 'div.item-details span', 'span[data-condition]'),
+        'functionality': ('span.functionality', 'div.item-details span', 'span[data-functionality]'),
+        'damage': ('span.damage-indicator', 'div.item-details span', 'span[data-damage]'),
+        'missing_items': ('span.missing-items', 'div.item-details span', 'span[data-missing-items]'),
+        'damage_description': ('div.damage-description', 'div.item-details div', 'div[data-damage-desc]'),
+        'missing_item_description': ('div.missing-items-desc', 'div.item-details div', 'div[data-missing-desc]'),
+        'notes': ('div.item-notes', 'div.item-details div', 'div[data-notes]'),
+    }.items()
+}
+
+# One selector list matching every field's elements, so a page is walked
+# once; each hit is then attributed to the (field, priority) pairs it serves
+_ALL_FIELDS_SELECTOR = sv.compile(', '.join(dict.fromkeys(
+    selector.pattern for selectors in _FIELD_SELECTORS.values() for selector in selectors
+)))
+
+def _build_selector_targets():
+    """Group (field, priority) pairs by selector so shared selectors are matched once"""
+    targets = {}
+    for field, selectors in _FIELD_SELECTORS.items():
+        for priority, selector in enumerate(selectors):
+            targets.setdefault(selector.pattern, (selector, []))[1].append((field, priority))
+    return tuple(targets.values())
+
+_SELECTOR_TARGETS = _build_selector_targets()
+
+def _element_text(element) -> str:
+    """Stripped text of a matched element"""
+    return element.text.strip()
+
+def _element_money(element) -> float:
+    """First dollar amount in a matched element's text; raises ValueError if there is none"""
+    match = _MONEY_RE.search(element.text)
+    if not match:
+        raise ValueError(f"No amount in {element.text!r}")
+    return float(match.group().replace(',', ''))
+
+# Per field: how to read a matched element, and the value when nothing usable
+# matches. A parser raising ValueError moves on to the next selector.
+_FIELD_PARSERS = {
+    'current_bid': (_element_money, 0.0),
+    'lot_number': (_element_text, "Unknown"),
+    'name': (_element_text, "Unknown"),
+    'brand': (_element_text, ""),
+    'model': (_element_text, ""),
+    'upc': (_element_text, ""),
+    'condition': (_element_text, ""),
+    'functionality': (_element_text, ""),
+    'damage': (lambda element: element.text.strip().lower() in _DAMAGE_TRUTHY, False),
+    'missing_items': (lambda element: element.text.strip().lower() in _MISSING_TRUTHY, False),
+    'damage_description': (_element_text, ""),
+    'missing_item_description': (_element_text, ""),
+    'notes': (_element_text, "")
+}
+
+# Every selector above starts from one of these tags, so item pages are
+# parsed into only those subtrees and head, scripts and other chrome are skipped
+_ITEM_PAGE_STRAINER = SoupStrainer(['span', 'div', 'h1'])
+
+# GraphQL lot search, built once. auctionId and the page are filled in per request.
+_LOT_SEARCH_QUERY = """
+    query LotSearch($auctionId: Int = null, $pageNumber: Int!, $pageLength: Int!, $category: CategoryId = null, $searchText: String = null, $zip: String = null, $miles: Int = null, $shippingOffered: Boolean = false, $countryName: String = null, $status: AuctionLotStatus = null, $sortOrder: EventItemSortOrder = null, $filter: AuctionLotFilter = null, $isArchive: Boolean = false, $dateStart: DateTime, $dateEnd: DateTime, $countAsView: Boolean = true, $hideGoogle: Boolean = false) {
+      lotSearch(
+        input: {auctionId: $auctionId, category: $category, searchText: $searchText, zip: $zip, miles: $miles, shippingOffered: $shippingOffered, countryName: $countryName, status: $status, sortOrder: $sortOrder, filter: $filter, isArchive: $isArchive, dateStart: $dateStart, dateEnd: $dateEnd, countAsView: $countAsView, hideGoogle: $hideGoogle}
+        pageNumber: $pageNumber
+        pageLength: $pageLength
+        sortDirection: DESC
+      ) {
+        pagedResults {
+          totalCount
+          results {
+            lotNumber
+            description
+            lotState {
+              highBid
+              minBid
+            }
+          }
+        }
+      }
+    }
+"""
+_LOT_SEARCH_VARIABLES = {
+    "category": None,
+    "searchText": None,
+    "zip": "",
+    "miles": 50,
+    "shippingOffered": False,
+    "countryName": "",
+    "status": "ALL",
+    "sortOrder": "LOT_NUMBER",
+    "filter": "ALL",
+    "isArchive": False,
+    "dateStart": None,
+    "dateEnd": None,
+    "countAsView": True,
+    "hideGoogle": False
+}
+
+@functools.lru_cache(maxsize=1024)
+def _parse_auction_date(date_str: str) -> Optional[str]:
+    """Convert a 'Month DD, YYYY' auction date to YYYY-MM-DD, or None if it does not parse"""
+    match = _DATE_RE.fullmatch(date_str)
+    if not match:
+        return None
+    
+    month = _MONTHS.get(match.group(1).lower())
+    day = int(match.group(2))
+    year = int(match.group(3))
+    if not month or not 1 <= day <= calendar.monthrange(year, month)[1]:
+        return None
+    return f'{year:04d}-{month:02d}-{day:02d}'
+
+def _parse_description(description: Optional[str]) -> Dict[str, Any]:
+    """
+    Parse item description text into structured data.
+    
+    Module-level so scrape_auction can hand it to worker processes.
+    
+    Args:
+        description: Lot description text (None is treated as empty)
+        
+    Returns:
+        Dictionary of item fields
+    """
+    data = {
+        'name': None,
+        'brand': None,
+        'model': None,
+        'upc': None,
+        'condition': None,
+        'functionality': None,
+        'damage': False,
+        'missing_items': False,
+        'damage_description': None,
+        'missing_items_description': None,
+        'notes': None
+    }
+    
+    for match in _FIELD_RE.finditer(description or ''):
+        key = _FIELD_MAP[match.group(1)]
+        value = match.group(2).strip()
+        if key in ('damage', 'missing_items'):
+            data[key] = value.lower() == 'yes'
+        else:
+            data[key] = value
+    
+    return data
+
 class HiBidScraper:
     def __init__(self, config):
         self.config = config
         self.scraping_config = config.get_scraping_config()
         self.session = requests.Session()
+        
+        # Size the pool for concurrent item fetches and retry transient failures.
+        # POST is retried too: the only POST is the read-only LotSearch query.
+        pool_size = max(self.scraping_config.get('scrape_workers', 16), 10)
+        retry = Retry(
+            total=self.scraping_config.get('max_retries', 3),
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({'GET', 'HEAD', 'POST'}),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Only advertise encodings urllib3 can decode here (br/zstd need
+        # optional packages), so compressed responses never arrive unreadable
+        self.accept_encoding = make_headers(accept_encoding=True)['accept-encoding']
         self.session.headers.update({
-            'User-Agent': self.scraping_config['user_agent']
+            'User-Agent': self.scraping_config['user_agent'],
+            'Accept-Encoding': self.accept_encoding
         })
         self.db = Database(self.config)
         
         # GraphQL configuration
         self.graphql_url = "https://hibid.com/graphql"
         self.headers = {
-            'authority': 'hibid.com',
-            'method': 'POST',
-            'path': '/graphql',
-            'scheme': 'https',
             'accept': 'application/json, text/plain, */*',
-            'accept-encoding': 'gzip, deflate, br, zstd',
+            'accept-encoding': self.accept_encoding,
             'accept-language': 'en-US,en;q=0.9',
             'content-type': 'application/json',
             'origin': 'https://hibid.com',
@@ -44,13 +270,35 @@ class HiBidScraper:
             'user-agent': 'Mozilla/5.0 (X11; CrOS x86_64 14541.0.0) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36'
         }
         
-        # Load cookies from config
+        # Load cookies from config into the session once, instead of merging
+        # them into a fresh jar on every request
         self.cookies = self.scraping_config.get('cookies', {})
+        self.session.cookies.update(self.cookies)
+        
+        # Item page validators and parsed details: url -> (etag, last_modified, item_data),
+        # least recently used first and capped at page_cache_size entries
+        self._page_cache = OrderedDict()
+        self._page_cache_size = self.scraping_config.get('page_cache_size', 1024)
+        self._page_cache_lock = threading.Lock()
+    
+    def close(self):
+        """Close the HTTP session and database connection"""
+        self.session.close()
+        self.db.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
     
     def scrape_auction(self, url: str) -> List[Dict[str, Any]]:
         """
         Scrape auction page to get item URLs and details using GraphQL API.
         
+        Lots without a UPC are skipped, since products are stored and
+        researched by UPC.
+        
         Args:
             url: URL of the auction page
             
@@ -67,167 +315,133 @@ class HiBidScraper:
             # Update headers with current URL
             self.headers['referer'] = url
             
-            # GraphQL query payload
-            payload = {
-                "operationName": "LotSearch",
-                "query": """
-                    query LotSearch($auctionId: Int = null, $pageNumber: Int!, $pageLength: Int!, $category: CategoryId = null, $searchText: String = null, $zip: String = null, $miles: Int = null, $shippingOffered: Boolean = false, $countryName: String = null, $status: AuctionLotStatus = null, $sortOrder: EventItemSortOrder = null, $filter: AuctionLotFilter = null, $isArchive: Boolean = false, $dateStart: DateTime, $dateEnd: DateTime, $countAsView: Boolean = true, $hideGoogle: Boolean = false) {
-                      lotSearch(
-                        input: {auctionId: $auctionId, category: $category, searchText: $searchText, zip: $zip, miles: $miles, shippingOffered: $shippingOffered, countryName: $countryName, status: $status, sortOrder: $sortOrder, filter: $filter, isArchive: $isArchive, dateStart: $dateStart, dateEnd: $dateEnd, countAsView: $countAsView, hideGoogle: $hideGoogle}
-                        pageNumber: $pageNumber
-                        pageLength: $pageLength
-                        sortDirection: DESC
-                      ) {
-                        pagedResults {
-                          results {
-                            lotNumber
-                            description
-                            lotState {
-                              highBid
-                              minBid
-                            }
-                          }
-                        }
-                      }
-                    }
-                """,
-                "variables": {
-                    "auctionId": auction_id,
-                    "pageNumber": 1,
-                    "pageLength": 9000,
-                    "category": None,
-                    "searchText": None,
-                    "zip": "",
-                    "miles": 50,
-                    "shippingOffered": False,
-                    "countryName": "",
-                    "status": "ALL",
-                    "sortOrder": "LOT_NUMBER",
-                    "filter": "ALL",
-                    "isArchive": False,
-                    "dateStart": None,
-                    "dateEnd": None,
-                    "countAsView": True,
-                    "hideGoogle": False
-                }
-            }
-            
-            # Make GraphQL request
-            response = self.session.post(
-                self.graphql_url,
-                headers=self.headers,
-                json=payload,
-                cookies=self.cookies
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"GraphQL request failed with status code: {response.status_code}")
+            # The first page also reports how many lots the auction has
+            page_length = self.scraping_config.get('lot_page_length', 500)
+            first_page = self._fetch_lot_page(auction_id, 1, page_length)
+            if first_page is None:
                 return []
             
-            # Parse response
-            data = response.json()
-            items = data['data']['lotSearch']['pagedResults']['results']
+            pages = [first_page['results']]
+            page_count = -(-(first_page.get('totalCount') or 0) // page_length)
+            if page_count > 1:
+                # Fetch the remaining pages concurrently, keeping lot order. The
+                # adapter has already retried, so a missing page fails the scrape
+                # rather than saving a partial auction.
+                workers = min(page_count - 1, self.scraping_config.get('scrape_workers', 16))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    for page in executor.map(
+                        lambda page_number: self._fetch_lot_page(auction_id, page_number, page_length),
+                        range(2, page_count + 1)
+                    ):
+                        if page is None:
+                            logger.error("Incomplete lot search for auction %s, not saving it", auction_id)
+                            return []
+                        pages.append(page['results'])
+            # A substring scan is enough to skip lots that can't carry a UPC
+            items = [
+                item for item in itertools.chain.from_iterable(pages)
+                if 'UPC:' in (item.get('description') or '')
+            ]
+            
+            # Parse descriptions, optionally across worker processes
+            descriptions = [item.get('description') for item in items]
+            parse_workers = self.scraping_config.get('parse_workers', 0)
+            if parse_workers:
+                with ProcessPoolExecutor(max_workers=parse_workers) as executor:
+                    parsed = list(executor.map(_parse_description, descriptions, chunksize=256))
+            else:
+                parsed = [_parse_description(description) for description in descriptions]
             
             # Process items
             processed_items = []
-            for item in items:
+            rows = []
+            for item, item_data in zip(items, parsed):
                 try:
                     # Extract basic information
                     lot_number = item['lotNumber']
                     current_bid = item['lotState'].get('highBid', item['lotState'].get('minBid', 0))
                     
-                    # Parse description
-                    description = item['description']
-                    item_data = self._parse_description(description)
-                    
                     # Add lot number and current bid
-                    item_data.update({
-                        'lot_number': lot_number,
-                        'current_bid': current_bid
-                    })
+                    item_data['lot_number'] = lot_number
+                    item_data['current_bid'] = current_bid
                     
-                    # Save to database
-                    if item_data.get('upc'):
-                        if not self.db.save_auction_item(auction_id, lot_number, current_bid, item_data['upc']):
-                            logger.error(f"Failed to save item {lot_number}")
-                            continue
+                    # Lots with an empty UPC line are skipped as well
+                    if not item_data['upc']:
+                        continue
                     
+                    rows.append((lot_number, current_bid, item_data['upc']))
                     processed_items.append(item_data)
                     
                 except Exception as e:
-                    logger.error(f"Error processing item {lot_number}: {str(e)}")
+                    logger.error("Error processing item %s: %s", item.get('lotNumber'), e)
                     continue
             
+            # Save all lots in one transaction
+            if not self.db.save_auction_items(auction_id, rows):
+                logger.error("Failed to save items for auction %s", auction_id)
+                return []
+            
             return processed_items
             
         except Exception as e:
-            logger.error(f"Error scraping auction: {str(e)}")
-            logger.debug(traceback.format_exc())
+            logger.error("Error scraping auction: %s", e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(traceback.format_exc())
             return []
     
-    def _extract_auction_id(self, url: str) -> Optional[int]:
-        """Extract auction ID from URL"""
+    def _fetch_lot_page(self, auction_id: int, page_number: int, page_length: int) -> Optional[Dict[str, Any]]:
+        """
+        Fetch one page of an auction's lots from the GraphQL API.
+        
+        Args:
+            auction_id: ID of the auction
+            page_number: 1-based page to fetch
+            page_length: Lots per page
+            
+        Returns:
+            The lotSearch pagedResults dictionary, or None if the request fails
+        """
+        payload = {
+            "operationName": "LotSearch",
+            "query": _LOT_SEARCH_QUERY,
+            "variables": {
+                **_LOT_SEARCH_VARIABLES,
+                "auctionId": auction_id,
+                "pageNumber": page_number,
+                "pageLength": page_length
+            }
+        }
+        
         try:
-            # URL format: https://hibid.com/catalog/{auction_id}/{auction_name}
-            parts = url.split('/')
-            for part in parts:
-                if part.isdigit():
-                    return int(part)
-            return None
-        except Exception:
+            response = self.session.post(
+                self.graphql_url,
+                headers=self.headers,
+                json=payload
+            )
+            
+            if response.status_code != 200:
+                logger.error("GraphQL request for page %s failed with status code: %s", page_number, response.status_code)
+                return None
+            
+            return _json_loads(response.content)['data']['lotSearch']['pagedResults']
+            
+        except (requests.RequestException, KeyError, TypeError, ValueError) as e:
+            logger.error("Error fetching page %s of auction %s: %s", page_number, auction_id, e)
             return None
     
-    def _parse_description(self, description: str) -> Dict[str, Any]:
-        """Parse item description text into structured data"""
-        data = {
-            'name': None,
-            'brand': None,
-            'model': None,
-            'upc': None,
-            'condition': None,
-            'functionality': None,
-            'damage': False,
-            'missing_items': False,
-            'damage_description': None,
-            'missing_items_description': None,
-            'notes': None
-        }
-        
-        lines = description.splitlines()
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-                
-            if line.startswith("Title:"):
-                data['name'] = line.replace("Title:", "").strip()
-            elif line.startswith("Brand:"):
-                data['brand'] = line.replace("Brand:", "").strip()
-            elif line.startswith("Model:"):
-                data['model'] = line.replace("Model:", "").strip()
-            elif line.startswith("UPC:"):
-                data['upc'] = line.replace("UPC:", "").strip()
-            elif line.startswith("Condition:"):
-                data['condition'] = line.replace("Condition:", "").strip()
-            elif line.startswith("Functional?:"):
-                data['functionality'] = line.replace("Functional?:", "").strip()
-            elif line.startswith("Damaged?:"):
-                data['damage'] = line.replace("Damaged?:", "").strip().lower() == 'yes'
-            elif line.startswith("Missing Parts?:"):
-                data['missing_items'] = line.replace("Missing Parts?:", "").strip().lower() == 'yes'
-            elif line.startswith("Damage Description:"):
-                data['damage_description'] = line.replace("Damage Description:", "").strip()
-            elif line.startswith("Missing Parts Description:"):
-                data['missing_items_description'] = line.replace("Missing Parts Description:", "").strip()
-            elif line.startswith("Notes:"):
-                data['notes'] = line.replace("Notes:", "").strip()
-        
-        return data
+    def _extract_auction_id(self, url: str) -> Optional[int]:
+        """Extract auction ID from URL"""
+        # URL format: https://hibid.com/catalog/{auction_id}/{auction_name}
+        match = _AUCTION_ID_RE.search(url)
+        return int(match.group(1)) if match else None
     
     def scrape_item(self, url: str) -> Optional[Dict[str, Union[str, float, bool]]]:
         """
         Scrape detailed information for a single HiBid item.
         
+        Pages scraped before are requested conditionally, and a 304 Not
+        Modified reuses the previously parsed details.
+        
         Args:
             url: The URL of the HiBid item page
             
@@ -235,250 +449,190 @@ class HiBidScraper:
             Dictionary containing item details or None if scraping fails
         """
         try:
-            response = self.session.get(url, timeout=self.scraping_config['request_timeout'])
+            headers = {}
+            with self._page_cache_lock:
+                cached = self._page_cache.get(url)
+                if cached:
+                    self._page_cache.move_to_end(url)
+            if cached:
+                etag, last_modified, cached_data = cached
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+            
+            response = self.session.get(url, headers=headers, timeout=self.scraping_config['request_timeout'])
+            if response.status_code == 304 and cached:
+                return dict(cached_data)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=_ITEM_PAGE_STRAINER)
             
-            # Extract item details
+            # Extract item details from a single walk of the page
+            matches = self._match_fields(soup)
             item_data = {
-                'current_bid': self._extract_current_bid(soup),
-                'lot_number': self._extract_lot_number(soup),
-                'name': self._extract_item_name(soup),
-                'brand': self._extract_brand(soup),
-                'model': self._extract_model(soup),
-                'upc': self._extract_upc(soup),
-                'condition': self._extract_condition(soup),
-                'functionality': self._extract_functionality(soup),
-                'damage': self._extract_damage(soup),
-                'missing_items': self._extract_missing_items(soup),
-                'damage_description': self._extract_damage_description(soup),
-                'missing_item_description': self._extract_missing_item_description(soup),
-                'notes': self._extract_notes(soup)
+                field: self._extract_field(soup, field, candidates)
+                for field, candidates in matches.items()
             }
             
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                with self._page_cache_lock:
+                    self._page_cache[url] = (etag, last_modified, dict(item_data))
+                    self._page_cache.move_to_end(url)
+                    while len(self._page_cache) > self._page_cache_size:
+                        self._page_cache.popitem(last=False)
+            
             return item_data
             
         except requests.RequestException as e:
-            logger.error(f"Error scraping item {url}: {str(e)}")
+            logger.error("Error scraping item %s: %s", url, e)
             return None
         except Exception as e:
-            logger.error(f"Unexpected error scraping item {url}: {str(e)}")
+            logger.error("Unexpected error scraping item %s: %s", url, e)
             return None
     
-    def _extract_current_bid(self, soup: BeautifulSoup) -> float:
-        """Extract current bid from item page"""
-        # Look for bid amount in various possible locations
-        bid_selectors = [
-            'span.current-bid-amount',  # Common selector
-            'div.bid-amount',           # Alternative selector
-            'span[data-bid-amount]'     # Data attribute selector
-        ]
+    def scrape_items(self, urls: List[str],
+                     max_workers: Optional[int] = None) -> List[Optional[Dict[str, Union[str, float, bool]]]]:
+        """
+        Scrape many HiBid item pages in parallel threads.
+        
+        Args:
+            urls: URLs of the HiBid item pages
+            max_workers: Maximum pages in flight (defaults to scrape_workers)
+            
+        Returns:
+            List of item dictionaries (None for failed pages) in the order of urls
+        """
+        if max_workers is None:
+            max_workers = self.scraping_config.get('scrape_workers', 16)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.scrape_item, urls))
+    
+    async def scrape_items_async(self, urls: List[str],
+                                 concurrency: Optional[int] = None) -> List[Optional[Dict[str, Union[str, float, bool]]]]:
+        """
+        Scrape many HiBid item pages concurrently.
+        
+        Each page is fetched by scrape_item on a bounded thread pool so the
+        shared session and its connection pool are reused.
+        
+        Args:
+            urls: URLs of the HiBid item pages
+            concurrency: Maximum pages in flight (defaults to scrape_workers)
+            
+        Returns:
+            List of item dictionaries (None for failed pages) in the order of urls
+        """
+        if concurrency is None:
+            concurrency = self.scraping_config.get('scrape_workers', 16)
+        
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            return await asyncio.gather(
+                *(loop.run_in_executor(pool, self.scrape_item, url) for url in urls)
+            )
+    
+    def _match_fields(self, soup: BeautifulSoup) -> Dict[str, List[Any]]:
+        """
+        Find the candidate elements for every item field in one pass over the page.
         
-        for selector in bid_selectors:
-            element = soup.select_one(selector)
+        Args:
+            soup: Parsed item page
+            
+        Returns:
+            Field name -> first element matched by each of its selectors, in priority order
+        """
+        first = {}
+        for element in _ALL_FIELDS_SELECTOR.select(soup):
+            for selector, targets in _SELECTOR_TARGETS:
+                if selector.match(element):
+                    for target in targets:
+                        first.setdefault(target, element)
+        
+        return {
+            field: [first[(field, priority)] for priority in range(len(selectors)) if (field, priority) in first]
+            for field, selectors in _FIELD_SELECTORS.items()
+        }
+    
+    def _extract_field(self, soup: BeautifulSoup, field: str, candidates: Optional[List[Any]] = None) -> Any:
+        """
+        Extract one item field, trying its selectors in priority order.
+        
+        Args:
+            soup: Parsed item page or lot element
+            field: Key of _FIELD_SELECTORS
+            candidates: Elements already matched by _match_fields, if any
+            
+        Returns:
+            The parsed field value, or the field's default
+        """
+        parse, default = _FIELD_PARSERS[field]
+        if candidates is None:
+            candidates = (selector.select_one(soup) for selector in _FIELD_SELECTORS[field])
+        
+        for element in candidates:
             if element:
                 try:
-                    # Remove currency symbol and commas, convert to float
-                    return float(element.text.strip().replace('$', '').replace(',', ''))
+                    return parse(element)
                 except ValueError:
                     continue
         
-        return 0.0
+        return default
+    
+    def _extract_current_bid(self, soup: BeautifulSoup) -> float:
+        """Extract current bid from item page"""
+        return self._extract_field(soup, 'current_bid')
     
     def _extract_lot_number(self, soup: BeautifulSoup) -> str:
         """Extract lot number from item page"""
-        # Look for lot number in various possible locations
-        lot_selectors = [
-            'span.lot-number',          # Common selector
-            'div.lot-info span',        # Alternative selector
-            'span[data-lot-number]'     # Data attribute selector
-        ]
-        
-        for selector in lot_selectors:
-            element = soup.select_one(selector)
-            if element:
-                return element.text.strip()
-        
-        return "Unknown"
+        return self._extract_field(soup, 'lot_number')
     
     def _extract_item_name(self, soup: BeautifulSoup) -> str:
         """Extract item name from item page"""
-        # Look for item name in various possible locations
-        name_selectors = [
-            'h1.item-title',            # Common selector
-            'div.item-details h1',      # Alternative selector
-            'span[data-item-name]'      # Data attribute selector
-        ]
-        
-        for selector in name_selectors:
-            element = soup.select_one(selector)
-            if element:
-                return element.text.strip()
-        
-        return "Unknown"
+        return self._extract_field(soup, 'name')
     
     def _extract_brand(self, soup: BeautifulSoup) -> str:
         """Extract brand from item page"""
-        # Look for brand in various possible locations
-        brand_selectors = [
-            'span.brand-name',          # Common selector
-            'div.item-details span',    # Alternative selector
-            'span[data-brand]'          # Data attribute selector
-        ]
-        
-        for selector in brand_selectors:
-            element = soup.select_one(selector)
-            if element:
-                return element.text.strip()
-        
-        return ""
+        return self._extract_field(soup, 'brand')
     
     def _extract_model(self, soup: BeautifulSoup) -> str:
         """Extract model from item page"""
-        # Look for model in various possible locations
-        model_selectors = [
-            'span.model-number',        # Common selector
-            'div.item-details span',    # Alternative selector
-            'span[data-model]'          # Data attribute selector
-        ]
-        
-        for selector in model_selectors:
-            element = soup.select_one(selector)
-            if element:
-                return element.text.strip()
-        
-        return ""
+        return self._extract_field(soup, 'model')
     
     def _extract_upc(self, soup: BeautifulSoup) -> str:
         """Extract UPC from item page"""
-        # Look for UPC in various possible locations
-        upc_selectors = [
-            'span.upc-code',            # Common selector
-            'div.item-details span',    # Alternative selector
-            'span[data-upc]'            # Data attribute selector
-        ]
-        
-        for selector in upc_selectors:
-            element = soup.select_one(selector)
-            if element:
-                return element.text.strip()
-        
-        return ""
+        return self._extract_field(soup, 'upc')
     
     def _extract_condition(self, soup: BeautifulSoup) -> str:
         """Extract condition from item page"""
-        # Look for condition in various possible locations
-        condition_selectors = [
-            'span.item-condition',      # Common selector
-            'div.item-details span',    # Alternative selector
-            'span[data-condition]'      # Data attribute selector
-        ]
-        
-        for selector in condition_selectors:
-            element = soup.select_one(selector)
-            if element:
-                return element.text.strip()
-        
-        return ""
+        return self._extract_field(soup, 'condition')
     
     def _extract_functionality(self, soup: BeautifulSoup) -> str:
         """Extract functionality from item page"""
-        # Look for functionality in various possible locations
-        func_selectors = [
-            'span.functionality',       # Common selector
-            'div.item-details span',    # Alternative selector
-            'span[data-functionality]'  # Data attribute selector
-        ]
-        
-        for selector in func_selectors:
-            element = soup.select_one(selector)
-            if element:
-                return element.text.strip()
-        
-        return ""
+        return self._extract_field(soup, 'functionality')
     
     def _extract_damage(self, soup: BeautifulSoup) -> bool:
         """Extract damage status from item page"""
-        # Look for damage indicator in various possible locations
-        damage_selectors = [
-            'span.damage-indicator',    # Common selector
-            'div.item-details span',    # Alternative selector
-            'span[data-damage]'         # Data attribute selector
-        ]
-        
-        for selector in damage_selectors:
-            element = soup.select_one(selector)
-            if element:
-                text = element.text.strip().lower()
-                return text == 'yes' or text == 'true' or text == 'damaged'
-        
-        return False
+        return self._extract_field(soup, 'damage')
     
     def _extract_missing_items(self, soup: BeautifulSoup) -> bool:
         """Extract missing items status from item page"""
-        # Look for missing items indicator in various possible locations
-        missing_selectors = [
-            'span.missing-items',       # Common selector
-            'div.item-details span',    # Alternative selector
-            'span[data-missing-items]'  # Data attribute selector
-        ]
-        
-        for selector in missing_selectors:
-            element = soup.select_one(selector)
-            if element:
-                text = element.text.strip().lower()
-                return text == 'yes' or text == 'true' or text == 'missing items'
-        
-        return False
+        return self._extract_field(soup, 'missing_items')
     
     def _extract_damage_description(self, soup: BeautifulSoup) -> str:
         """Extract damage description from item page"""
-        # Look for damage description in various possible locations
-        damage_desc_selectors = [
-            'div.damage-description',   # Common selector
-            'div.item-details div',     # Alternative selector
-            'div[data-damage-desc]'     # Data attribute selector
-        ]
-        
-        for selector in damage_desc_selectors:
-            element = soup.select_one(selector)
-            if element:
-                return element.text.strip()
-        
-        return ""
+        return self._extract_field(soup, 'damage_description')
     
     def _extract_missing_item_description(self, soup: BeautifulSoup) -> str:
         """Extract missing items description from item page"""
-        # Look for missing items description in various possible locations
-        missing_desc_selectors = [
-            'div.missing-items-desc',   # Common selector
-            'div.item-details div',     # Alternative selector
-            'div[data-missing-desc]'    # Data attribute selector
-        ]
-        
-        for selector in missing_desc_selectors:
-            element = soup.select_one(selector)
-            if element:
-                return element.text.strip()
-        
-        return ""
+        return self._extract_field(soup, 'missing_item_description')
     
     def _extract_notes(self, soup: BeautifulSoup) -> str:
         """Extract general notes from item page"""
-        # Look for notes in various possible locations
-        notes_selectors = [
-            'div.item-notes',           # Common selector
-            'div.item-details div',     # Alternative selector
-            'div[data-notes]'           # Data attribute selector
-        ]
-        
-        for selector in notes_selectors:
-            element = soup.select_one(selector)
-            if element:
-                return element.text.strip()
-        
-        return ""
+        return self._extract_field(soup, 'notes')
     
     # Keep existing methods for auction scraping
     def _extract_auction_title(self, soup: BeautifulSoup) -> str:
@@ -490,11 +644,9 @@ class HiBidScraper:
         """Extract auction date from page"""
         date_element = soup.find('div', class_='auction-date')
         if date_element:
-            try:
-                date_str = date_element.text.strip()
-                return datetime.strptime(date_str, '%B %d, %Y').strftime('%Y-%m-%d')
-            except ValueError:
-                pass
+            parsed = _parse_auction_date(date_element.text.strip())
+            if parsed:
+                return parsed
         return datetime.now().strftime('%Y-%m-%d')
     
     def _extract_items(self, soup: BeautifulSoup) -> list:
@@ -504,15 +656,29 @@ class HiBidScraper:
         
         for element in item_elements:
             try:
+                # Lots use the common layout almost always, so look for its
+                # elements directly and only try the other selectors on a miss
+                lot_number = element.find('span', class_='lot-number')
+                name = element.find('h1', class_='item-title')
+                bid = element.find('span', class_='current-bid-amount')
+                notes = element.find('div', class_='item-notes')
+                
+                current_bid = None
+                if bid:
+                    try:
+                        current_bid = _element_money(bid)
+                    except ValueError:
+                        pass
+                
                 item = {
-                    'lot_number': self._extract_lot_number(element),
-                    'name': self._extract_item_name(element),
-                    'current_bid': self._extract_current_bid(element),
-                    'notes': self._extract_notes(element)
+                    'lot_number': lot_number.text.strip() if lot_number else self._extract_lot_number(element),
+                    'name': name.text.strip() if name else self._extract_item_name(element),
+                    'current_bid': current_bid if current_bid is not None else self._extract_current_bid(element),
+                    'notes': notes.text.strip() if notes else self._extract_notes(element)
                 }
                 items.append(item)
             except Exception as e:
-                logger.error(f"Error extracting item: {str(e)}")
+                logger.error("Error extracting item: %s", e)
                 continue
         
-        return items 
\ No newline at end of file
+        return items